@@ -0,0 +1,27 @@
+"""
+Production settings for the webhook server:
+
+    gunicorn -c gunicorn.conf.py webhook_server:app
+
+`python webhook_server.py` remains the simple option for local use.
+"""
+import os
+
+from dotenv import load_dotenv
+
+# WEBHOOK_PORT / WEBHOOK_THREADS may live in .env, which the app only loads later
+load_dotenv()
+
+bind = f"0.0.0.0:{os.environ.get('WEBHOOK_PORT', '8000')}"
+
+# A single worker process: each process runs its own sync worker, and several
+# of them would race each other on synced_events.json and the Calendar quota.
+# Concurrency for incoming webhooks comes from threads instead.
+workers = 1
+worker_class = "gthread"
+threads = int(os.environ.get("WEBHOOK_THREADS", "8"))
+
+# Import the app (and the Notion/Google client libraries) once in the master;
+# restarted workers fork from it instead of re-importing everything.
+preload_app = True
+timeout = 30
@@ -1,10 +1,13 @@
+import os
 import json
-from notion_to_gcal import get_notion_events  # replace with your filename (without .py)
+from notion_to_gcal import create_notion_client, get_notion_event_ids  # replace with your filename (without .py)
 
-events = get_notion_events()
-synced_ids = [e['id'] for e in events]
+# Only the page IDs are needed here, so skip the (slow) page content fetch.
+notion = create_notion_client(os.environ.get("NOTION_TOKEN"))
+synced_ids = get_notion_event_ids(notion, os.environ.get("NOTION_DATABASE_ID"))
 
-with open('synced_events.json', 'w') as f:
+# Written next to (not over) synced_events.json, which holds the sync mapping.
+with open('notion_event_ids.json', 'w') as f:
     json.dump(synced_ids, f, indent=2)
 
-print(f"✅ Initialized with {len(synced_ids)} Notion events.")
+print(f"✅ Found {len(synced_ids)} Notion events.")
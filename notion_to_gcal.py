@@ -1,10 +1,18 @@
 import os
+import io
 import sys
 import json
+import time
+import random
+import tempfile
+import threading
 import hashlib
 import logging
 import argparse
+import functools
 import importlib.metadata
+from datetime import datetime, timedelta, timezone
+from concurrent.futures import ThreadPoolExecutor
 
 # Ensure importlib.metadata has packages_distributions on Python 3.8
 try:  # pragma: no cover
@@ -16,15 +24,13 @@ except Exception:
 
 from dotenv import load_dotenv
 load_dotenv()
+import httpx
 from notion_client import Client as NotionClient
 from notion_client.errors import RequestTimeoutError
 from google.oauth2.credentials import Credentials
-from google_auth_oauthlib.flow import InstalledAppFlow
-from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
 from google.auth.transport.requests import Request
 from google.auth.exceptions import RefreshError
-import dateutil.parser
 import notion_client
 
 
@@ -32,7 +38,18 @@ import notion_client
 DATE_PROPERTY_NAME = "Do Date"
 CALENDAR_ID = "primary"
 SYNC_FILE = "synced_events.json"
+CONTENT_CACHE_FILE = "content_cache.json"
+EVENT_HASH_VERSION = "v1-reminders"  # Bump to re-push every event after a body format change
 SCOPES = ["https://www.googleapis.com/auth/calendar"]
+_PROPERTY_IDS = {}  # database_id -> [title_id, date_id], see get_property_ids
+GCAL_BATCH_SIZE = 50  # Max sub-requests per Calendar batch request
+NOTION_CONTENT_WORKERS = 8  # Concurrent page-content fetches
+NOTION_RPS = 3  # Notion's documented average rate limit per integration
+NOTION_MAX_RETRIES = 4  # Attempts per Notion call on 429/503 (waits ~1s, 2s, 4s)
+NOTION_RETRYABLE_STATUSES = (429, 503)
+GCAL_MAX_RETRIES = 7  # Attempts per Calendar call on rate limits / 5xx
+GCAL_RETRYABLE_STATUSES = (429, 500, 502, 503, 504)
+GCAL_RPS = float(os.environ.get("GCAL_RPS", "10"))  # Sustained Calendar requests/second
 
 # Setup logging
 class ConsoleFilter(logging.Filter):
@@ -78,9 +95,42 @@ def compute_event_hash(event):
     """Compute a deterministic hash of the event data relevant for sync."""
     # Create a string representation of relevant fields
     # Use deterministic sorting for dictionary keys if any
-    data_str = f"v1-reminders|{event['title']}|{event['start']}|{event['end']}|{event['description']}"
+    data_str = f"{EVENT_HASH_VERSION}|{event['title']}|{event['start']}|{event['end']}|{event['description']}"
     return hashlib.md5(data_str.encode("utf-8")).hexdigest()
 
+def synced_edit_time(event):
+    """
+    The last_edited_time to record for a synced event. None when its content
+    could not be fetched this run, so the next run compares hashes instead of
+    skipping the page as unchanged.
+    """
+    return event["last_edited_time"] if event.get("content_ok", True) else None
+
+def utc_now():
+    """Current UTC time as an ISO string, the format stored next to edit times."""
+    return datetime.now(timezone.utc).isoformat()
+
+def edit_time_settled(last_edited_time, checked_at):
+    """
+    True if a page showing `last_edited_time` when it was read at `checked_at`
+    can't have been edited again since without the timestamp changing.
+    Notion's last_edited_time only has minute resolution, so a second edit in
+    the same minute keeps the same value; the time is only trusted once it is
+    older than the minute it was read in (minus one more for clock skew).
+    """
+    if not last_edited_time or not checked_at:
+        return False
+    try:
+        edited = datetime.fromisoformat(last_edited_time.replace("Z", "+00:00"))
+        checked = datetime.fromisoformat(checked_at.replace("Z", "+00:00"))
+        return edited < checked.replace(second=0, microsecond=0) - timedelta(minutes=1)
+    except (TypeError, ValueError):
+        return False
+
+def gcal_id_of(sync_data):
+    """Google event ID of a synced entry (legacy entries are just the ID string)."""
+    return sync_data if isinstance(sync_data, str) else sync_data.get("gcal_id")
+
 def format_uuid(id_str):
     """Ensure UUID is formatted with dashes."""
     if not id_str: 
@@ -89,11 +139,90 @@ def format_uuid(id_str):
         return f"{id_str[:8]}-{id_str[8:12]}-{id_str[12:16]}-{id_str[16:20]}-{id_str[20:]}"
     return id_str
 
+class TokenBucket:
+    """
+    Client-side rate limiter: allows `burst` calls at once, then `rate` per
+    second. take() blocks until the caller may proceed.
+    """
+
+    def __init__(self, rate, burst):
+        self.rate = rate
+        self.burst = burst
+        self._tokens = burst
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def take(self, tokens=1):
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._last) * self.rate)
+            self._last = now
+            # Go into debt rather than refusing costs larger than the burst
+            # (a full batch request); later callers wait it off.
+            self._tokens -= tokens
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0
+        if wait:
+            time.sleep(wait)
+
+
+GCAL_BUCKET = TokenBucket(GCAL_RPS, 2 * GCAL_RPS)
+NOTION_BUCKET = TokenBucket(NOTION_RPS, NOTION_RPS)
+
+
+def is_retryable(exc):
+    """True for Google API errors that go away on their own (rate limits, 5xx)."""
+    if not isinstance(exc, HttpError):
+        return False
+    status = exc.resp.status
+    if status == 403:
+        # 403 is also used for real permission errors; only retry rate limits.
+        return b"ateLimitExceeded" in (exc.content or b"")
+    return status in GCAL_RETRYABLE_STATUSES
+
+
+def backoff_delay(attempt, retry_after=None):
+    """Seconds to wait before retry number `attempt`, honoring Retry-After."""
+    if retry_after and retry_after.isdigit():
+        return float(retry_after)
+    return min(2 ** attempt, 64) + random.random()
+
+
+def google_retry_after(exc):
+    """The Retry-After header of a Google API error, if any."""
+    return exc.resp.get("retry-after") if isinstance(exc, HttpError) else None
+
+
+def call_with_backoff(request, max_retries=GCAL_MAX_RETRIES, cost=1):
+    """
+    Executes a Google API request (or batch), retrying rate-limit and server
+    errors with exponential backoff and jitter. Every attempt first takes
+    `cost` tokens (one per sub-request) from GCAL_BUCKET, so we stay under
+    the quota instead of only reacting to 403/429s.
+    """
+    for attempt in range(max_retries):
+        GCAL_BUCKET.take(cost)
+        try:
+            return request.execute()
+        except HttpError as e:
+            if not is_retryable(e) or attempt == max_retries - 1:
+                raise
+            delay = backoff_delay(attempt, google_retry_after(e))
+            logger.warning(f"Google API returned {e.resp.status}, retrying in {delay:.1f}s...")
+            time.sleep(delay)
+
+
 # ------------- AUTH GOOGLE -------------- #
+@functools.lru_cache(maxsize=1)
 def authenticate_google():
     """
     Authenticate with Google Calendar, auto-recovering from bad refresh tokens.
+    The service is built once per process and reused by later run_sync calls;
+    its credentials refresh themselves when the access token runs out.
     """
+    # Imported here: the discovery client is heavy and runs that skip on an
+    # unchanged fingerprint never talk to Google at all.
+    from googleapiclient.discovery import build
+
     creds = None
     if os.path.exists("token.json"):
         try:
@@ -107,40 +236,96 @@ def authenticate_google():
 
     def new_login():
         logger.info("Initiating new Google OAuth login...")
+        # Only needed for interactive logins; pulls in requests_oauthlib
+        from google_auth_oauthlib.flow import InstalledAppFlow
         flow = InstalledAppFlow.from_client_secrets_file("credentials.json", SCOPES)
         fresh_creds = flow.run_local_server(port=0)
         save(fresh_creds)
         return fresh_creds
 
-    if not creds:
-        return build("calendar", "v3", credentials=new_login())
-
-    if creds.valid:
-        return build("calendar", "v3", credentials=creds)
+    # Not just `expired`: that is False when there is no expiry at all (a
+    # token.json with only a refresh token), which must still be refreshed.
+    if creds and not creds.valid and creds.refresh_token:
+        try:
+            creds.refresh(Request())
+            save(creds)
+        except RefreshError:
+            logger.warning("Token expired and refresh failed. Re-authenticating.")
+            creds = None
+        except Exception as e:
+            logger.error(f"Unexpected auth error: {e}")
+            creds = None
 
-    try:
-        creds.refresh(Request())
-        save(creds)
-    except RefreshError:
-        logger.warning("Token expired and refresh failed. Re-authenticating.")
-        creds = new_login()
-    except Exception as e:
-        logger.error(f"Unexpected auth error: {e}")
+    if not creds or not creds.valid:
         creds = new_login()
 
-    return build("calendar", "v3", credentials=creds)
+    # static_discovery: use the Calendar discovery doc bundled with the client
+    # instead of downloading it on every run.
+    return build("calendar", "v3", credentials=creds, cache_discovery=False, static_discovery=True)
 
 
 # -------------- NOTION ------------------ #
+class RateLimitedTransport(httpx.HTTPTransport):
+    """
+    httpx transport for the Notion client: every request first takes a token
+    from NOTION_BUCKET, and 429/503 responses are retried with exponential
+    backoff (honoring Retry-After) instead of failing the whole run.
+    """
+
+    def handle_request(self, request):
+        for attempt in range(NOTION_MAX_RETRIES):
+            NOTION_BUCKET.take()
+            response = super().handle_request(request)
+            if response.status_code not in NOTION_RETRYABLE_STATUSES or attempt == NOTION_MAX_RETRIES - 1:
+                return response
+            delay = backoff_delay(attempt, response.headers.get("retry-after"))
+            response.close()
+            logger.warning(f"Notion API returned {response.status_code}, retrying in {delay:.1f}s...")
+            time.sleep(delay)
+
+
+def create_notion_client(token):
+    """Notion client whose calls are rate limited and retried, see RateLimitedTransport."""
+    return NotionClient(auth=token, client=httpx.Client(transport=RateLimitedTransport()))
+
+
+# Server-side filter: undated pages can never become events
+DATED_PAGES_FILTER = {"property": DATE_PROPERTY_NAME, "date": {"is_not_empty": True}}
+
+
+def _format_plain(text, data):
+    return text
+
+
+def _format_heading(text, data):
+    return f"\n{text.upper()}\n"
+
+
+# block type -> formatter(text, block_data) for one line of the description
+_BLOCK_FORMATTERS = {
+    "bulleted_list_item": lambda text, data: f"• {text}",
+    "numbered_list_item": lambda text, data: f"• {text}",
+    "heading_1": _format_heading,
+    "heading_2": _format_heading,
+    "heading_3": _format_heading,
+    "to_do": lambda text, data: f"{'✅' if data.get('checked') else '☐'} {text}",
+    "quote": lambda text, data: f"> {text}",
+    "callout": lambda text, data: f"{data.get('icon', {}).get('emoji', '💡')} {text}",
+}
+
+
 def get_page_content(notion, page_id):
-    """Fetch readable text content from a Notion page."""
-    texts = []
+    """
+    Fetch readable text content from a Notion page.
+    Returns None if the content could not be fetched.
+    """
+    buf = io.StringIO()
     next_cursor = None
 
     try:
         while True:
             blocks = notion.blocks.children.list(
-                block_id=page_id, start_cursor=next_cursor, page_size=50
+                block_id=page_id, start_cursor=next_cursor, page_size=100
             )
 
             for block in blocks.get("results", []):
@@ -152,20 +337,8 @@ def get_page_content(notion, page_id):
 
                 text_content = "".join([t.get("plain_text", "") for t in rich_text])
 
-                if block_type in ["bulleted_list_item", "numbered_list_item"]:
-                    texts.append(f"• {text_content}")
-                elif block_type.startswith("heading_"):
-                    texts.append(f"\n{text_content.upper()}\n")
-                elif block_type == "to_do":
-                    checked = "✅" if block[block_type].get("checked") else "☐"
-                    texts.append(f"{checked} {text_content}")
-                elif block_type == "quote":
-                    texts.append(f"> {text_content}")
-                elif block_type == "callout":
-                    icon = block[block_type].get("icon", {}).get("emoji", "💡")
-                    texts.append(f"{icon} {text_content}")
-                else:
-                    texts.append(text_content)
+                fmt = _BLOCK_FORMATTERS.get(block_type, _format_plain)
+                buf.write(fmt(text_content, block[block_type]) + "\n")
 
             if not blocks.get("has_more"):
                 break
@@ -173,10 +346,13 @@ def get_page_content(notion, page_id):
 
     except RequestTimeoutError:
         logger.error(f"Timeout fetching content for {page_id}")
+        return None
     except Exception as e:
         logger.error(f"Failed to fetch content for {page_id}: {e}")
+        return None
 
-    return "\n".join(texts).strip()
+    # Every block ends in a newline; strip() drops the final one
+    return buf.getvalue().strip()
 
 
 def fetch_pages_via_search(notion, database_id):
@@ -221,15 +397,50 @@ def fetch_pages_via_search(notion, database_id):
     return pages
 
 
-def get_notion_events(notion_token, database_id):
-    if not notion_token or not database_id:
-        raise EnvironmentError("Missing NOTION_TOKEN or NOTION_DATABASE_ID.")
+def get_property_ids(notion, database_id):
+    """
+    Looks up (once per process) the IDs of the title and date properties, so
+    queries can ask Notion to leave every other property out of the response.
+    Returns an empty list if the lookup fails, meaning "don't filter".
+    """
+    if database_id not in _PROPERTY_IDS:
+        try:
+            database = notion.databases.retrieve(database_id=database_id)
+            props = database.get("properties", {})
+            ids = [props[name]["id"] for name in ("Name", DATE_PROPERTY_NAME) if name in props]
+        except Exception as e:
+            logger.warning(f"Could not look up property IDs ({e}); fetching all properties.")
+            ids = []
+        _PROPERTY_IDS[database_id] = ids
+    return _PROPERTY_IDS[database_id]
+
+
+def get_notion_events(notion, database_id, content_cache=None, pages=None):
+    """
+    Fetches all dated pages of the database as event dicts.
+    `notion` is shared with the fingerprint scan so both reuse the same
+    pooled HTTP connections.
+    `content_cache` (page_id -> {"last_edited_time", "description", "fetched_at"}) is used
+    to skip re-fetching page content for pages that were not edited since.
+    `pages` are the raw pages from scan_database; when given, the database is
+    not listed a second time.
+    """
+    if not database_id:
+        raise EnvironmentError("Missing NOTION_DATABASE_ID.")
 
-    notion = NotionClient(auth=notion_token)
     has_more = True
     next_cursor = None
     events = []
 
+    if pages is not None:
+        for page in pages:
+            event = _process_page(page)
+            if event:
+                events.append(event)
+        fetch_page_contents(notion, events, content_cache)
+        logger.info(f"Found {len(events)} events in Notion.")
+        return events
+
     logger.info("Fetching events from Notion...")
     
     # Try standard query first
@@ -239,16 +450,23 @@ def get_notion_events(notion_token, database_id):
         if not hasattr(notion.databases, "query"):
              raise AttributeError("Client missing databases.query")
 
+        # Only ask for the properties we actually read
+        prop_ids = get_property_ids(notion, database_id)
+        extra = {"filter_properties": prop_ids} if prop_ids else {}
+
         # Standard Query Loop
         while has_more:
             query = notion.databases.query(
                 database_id=database_id, 
                 start_cursor=next_cursor if next_cursor else None,
+                page_size=100,
+                filter=DATED_PAGES_FILTER,
+                **extra,
             )
             raw_pages = query.get("results", [])
             for page in raw_pages:
                 # Helper to process page (since we duplicates logic otherwise)
-                event = _process_page(notion, page)
+                event = _process_page(page)
                 if event:
                     events.append(event)
 
@@ -260,15 +478,98 @@ def get_notion_events(notion_token, database_id):
         # Fallback: Fetch ALL pages via search and filter by DB ID
         raw_pages = fetch_pages_via_search(notion, database_id)
         for page in raw_pages:
-             event = _process_page(notion, page)
+             event = _process_page(page)
              if event:
                  events.append(event)
 
+    fetch_page_contents(notion, events, content_cache)
+
     logger.info(f"Found {len(events)} events in Notion.")
     return events
 
 
-def _process_page(notion, page):
+def fetch_page_contents(notion, events, content_cache=None):
+    """
+    Fills in each event's description from its page content.
+    Pages whose last_edited_time matches the cache reuse the cached text, if
+    that time was already settled when the text was fetched (see
+    edit_time_settled); the rest are fetched concurrently since each one costs at least one
+    blocks.children.list round trip.
+    """
+    if content_cache is None:
+        content_cache = {}
+
+    to_fetch = []
+    for event in events:
+        cached = content_cache.get(event["id"])
+        if (cached and cached.get("last_edited_time") == event["last_edited_time"]
+                and edit_time_settled(event["last_edited_time"], cached.get("fetched_at"))):
+            event["description"] = cached["description"]
+        else:
+            to_fetch.append(event)
+
+    if to_fetch:
+        logger.info(f"Fetching content for {len(to_fetch)} changed pages ({len(events) - len(to_fetch)} cached).")
+        # Taken before fetching: the text can't be older than this
+        fetched_at = utc_now()
+
+        with ThreadPoolExecutor(max_workers=NOTION_CONTENT_WORKERS) as pool:
+            contents = pool.map(lambda e: get_page_content(notion, e["id"]), to_fetch)
+            for event, content in zip(to_fetch, contents):
+                if content is None:
+                    # Don't cache a failed fetch; fall back to the last known text.
+                    cached = content_cache.get(event["id"]) or {}
+                    event["description"] = cached.get("description", "")
+                    event["content_ok"] = False
+                    continue
+                event["description"] = content
+                content_cache[event["id"]] = {
+                    "last_edited_time": event["last_edited_time"],
+                    "description": content,
+                    "fetched_at": fetched_at,
+                }
+
+
+def get_notion_event_ids(notion, database_id):
+    """
+    Lists the IDs of the dated pages in the database without fetching any
+    page content. Much cheaper than get_notion_events when only IDs are needed.
+    """
+    if not database_id:
+        raise EnvironmentError("Missing NOTION_DATABASE_ID.")
+
+    def is_dated(page):
+        return bool(page.get("properties", {}).get(DATE_PROPERTY_NAME, {}).get("date"))
+
+    ids = []
+    has_more = True
+    next_cursor = None
+    try:
+        if not hasattr(notion.databases, "query"):
+            raise AttributeError("Client missing databases.query")
+
+        prop_ids = get_property_ids(notion, database_id)
+        extra = {"filter_properties": prop_ids} if prop_ids else {}
+        while has_more:
+            query = notion.databases.query(
+                database_id=database_id,
+                start_cursor=next_cursor if next_cursor else None,
+                page_size=100,
+                filter=DATED_PAGES_FILTER,
+                **extra,
+            )
+            ids.extend(p["id"] for p in query.get("results", []) if is_dated(p))
+            has_more = query.get("has_more", False)
+            next_cursor = query.get("next_cursor")
+
+    except Exception as e:
+        logger.warning(f"Standard database query failed ({e}). Switching to Search Fallback.")
+        ids = [p["id"] for p in fetch_pages_via_search(notion, database_id) if is_dated(p)]
+
+    return ids
+
+
+def _process_page(page):
     """Parses a Notion page object into an event dict."""
     try:
         props = page.get("properties", {})
@@ -288,15 +589,14 @@ def _process_page(notion, page):
         start = date_prop["start"]
         end = date_prop.get("end", start)
 
-        # Content
-        content = get_page_content(notion, page["id"])
-
+        # Content is filled in afterwards by fetch_page_contents
         return {
             "id": page["id"],
             "title": title,
             "start": start,
             "end": end,
-            "description": content,
+            "description": "",
+            "last_edited_time": page.get("last_edited_time"),
         }
     except Exception as exc:
         logger.error(f"Failed to process page {page.get('id')}: {exc}")
@@ -306,14 +606,16 @@ def _process_page(notion, page):
     return events
 
 
-def get_database_fingerprint(notion, database_id):
+def scan_database(notion, database_id):
     """
-    Computes a 'fingerprint' of the current state of the database.
-    This includes ALL pages (IDs and last_edited_time).
+    Lists every page of the database once and computes a 'fingerprint' of
+    its current state from ALL pages (IDs and last_edited_time).
     Any change (add, edit, delete) will change this fingerprint.
+    Returns (fingerprint, pages); the pages feed get_notion_events so a sync
+    doesn't list the database twice. Returns (None, None) on failure.
     """
     try:
-        # Dictionary to store unique pages: id -> last_edited_time
+        # Dictionary to store unique pages: id -> page
         # This implicitly handles deduplication if we switch strategies or retry.
         page_tracker = {}
         
@@ -324,6 +626,10 @@ def get_database_fingerprint(notion, database_id):
 
         # Use query if available, else search fallback (implemented inline for simplicity/speed)
         use_search = not hasattr(notion.databases, "query")
+        if not use_search:
+            # filter_properties must be property IDs (names give a 400)
+            prop_ids = get_property_ids(notion, database_id)
+            extra = {"filter_properties": prop_ids} if prop_ids else {}
         
         while has_more:
             current_batch = []
@@ -332,8 +638,8 @@ def get_database_fingerprint(notion, database_id):
                     query = notion.databases.query(
                         database_id=database_id,
                         start_cursor=next_cursor if next_cursor else None,
-                        page_size=100
-                        # Removed filter_properties as it causes 400 on query endpoint
+                        page_size=100,
+                        **extra,
                     )
                     current_batch = query.get("results", [])
                     has_more = query.get("has_more", False)
@@ -369,26 +675,21 @@ def get_database_fingerprint(notion, database_id):
                 if page.get("archived"):
                     continue
                 
-                p_id = page["id"]
-                p_time = page["last_edited_time"]
-                
                 # 2. Store in dictionary (deduplicates automatically)
-                page_tracker[p_id] = p_time
+                page_tracker[page["id"]] = page
 
-        # 3. Create deterministic string
-        # Sort by ID to ensure order
-        sorted_ids = sorted(page_tracker.keys())
-        
-        lines = [f"COUNT:{len(sorted_ids)}"]
-        for p_id in sorted_ids:
-            lines.append(f"{p_id}|{page_tracker[p_id]}")
+        # 3. Hash a deterministic representation
+        # Sort by ID to ensure order. Lines are fed to the hash one by one
+        # (same bytes as "\n".join(lines)) instead of building one big string.
+        digest = hashlib.md5(f"COUNT:{len(page_tracker)}".encode("utf-8"))
+        for p_id, page in sorted(page_tracker.items()):
+            digest.update(f"\n{p_id}|{page['last_edited_time']}".encode("utf-8"))
 
-        full_str = "\n".join(lines)
-        return hashlib.md5(full_str.encode("utf-8")).hexdigest()
+        return digest.hexdigest(), list(page_tracker.values())
 
     except Exception as e:
         logger.warning(f"Failed to compute fingerprint: {e}")
-        return None
+        return None, None
 
 
 # --------- Sync File Helpers ---------- #
@@ -396,19 +697,78 @@ def load_synced_events():
     if os.path.exists(SYNC_FILE):
         try:
             with open(SYNC_FILE, "r") as f:
-                return json.load(f)
+                data = json.load(f)
+            if not isinstance(data, dict):
+                logger.warning("Unrecognised synced_events.json format, starting fresh.")
+                return {"events": {}, "last_run": None}
+            # Backwards compatibility: old files were a flat notion_id -> gcal mapping
+            if "events" not in data:
+                data = {"events": data, "last_run": None}
+            return data
         except json.JSONDecodeError:
             logger.warning("Corrupt synced_events.json, starting fresh.")
             return {"events": {}, "last_run": None}
     return {"events": {}, "last_run": None}
 
 
+def _file_mode(path):
+    """Permission bits for `path`: the current file's, else 0666 minus the umask."""
+    try:
+        return os.stat(path).st_mode & 0o777
+    except FileNotFoundError:
+        umask = os.umask(0)
+        os.umask(umask)
+        return 0o666 & ~umask
+
+
+def write_json_atomic(path, data):
+    """
+    Writes JSON to a temp file and swaps it in, so an interrupted run can't
+    leave a truncated file behind.
+    """
+    target_dir = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(dir=target_dir, prefix=".tmp_", suffix=".json")
+    try:
+        # One-shot compact dumps() runs on the C encoder; json.dump() or indent
+        # fall back to the pure-Python one. Use `python -m json.tool` to read.
+        with os.fdopen(fd, "w") as f:
+            f.write(json.dumps(data, separators=(",", ":")))
+            # Make sure the bytes are on disk before the rename commits them
+            f.flush()
+            os.fsync(f.fileno())
+        # mkstemp creates the file as 0600; keep the permissions a plain
+        # open() would give (or the existing file's) so other users can still read it.
+        os.chmod(tmp_path, _file_mode(path))
+        os.replace(tmp_path, path)
+    except Exception:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
 def save_synced_events(data, dry_run=False):
     if dry_run:
         logger.info("[Dry Run] Would save synced_events.json")
         return
-    with open(SYNC_FILE, "w") as f:
-        json.dump(data, f, indent=2)
+    write_json_atomic(SYNC_FILE, data)
+
+
+def load_content_cache():
+    """Page content cache: page_id -> {"last_edited_time", "description", "fetched_at"}."""
+    if os.path.exists(CONTENT_CACHE_FILE):
+        try:
+            with open(CONTENT_CACHE_FILE, "r") as f:
+                return json.load(f)
+        except json.JSONDecodeError:
+            logger.warning("Corrupt content_cache.json, starting fresh.")
+    return {}
+
+
+def save_content_cache(cache, dry_run=False):
+    if dry_run:
+        logger.info("[Dry Run] Would save content_cache.json")
+        return
+    write_json_atomic(CONTENT_CACHE_FILE, cache)
 
 
 # -------- Clean Logging -------- #
@@ -436,6 +796,12 @@ def get_clean_logger():
     return clean_logger
 
 # -------- Calendar Create/Update/Delete -------- #
+# Shared by every event body; the client serializes bodies when a request is
+# built, so this is never mutated.
+_EXT_PROPS = {"private": {"source": "notion-sync"}}
+_REMINDERS = {"useDefault": True}
+
+
 def build_event_body(event):
     start_raw = event["start"]
     end_raw = event["end"] or event["start"]
@@ -455,80 +821,160 @@ def build_event_body(event):
         "description": event["description"],
         "start": start,
         "end": end,
-        "extendedProperties": {"private": {"source": "notion-sync"}},
-        "reminders": {"useDefault": True},
+        "extendedProperties": _EXT_PROPS,
+        "reminders": _REMINDERS,
     }
 
 
+def execute_batched(gcal, requests, callback):
+    """
+    Sends (request_id, HttpRequest) pairs to Google as batch requests,
+    GCAL_BATCH_SIZE at a time. Rate-limited sub-requests are retried with
+    backoff; each final result is handed to
+    callback(request_id, response, exception).
+    """
+    for i in range(0, len(requests), GCAL_BATCH_SIZE):
+        pending = requests[i:i + GCAL_BATCH_SIZE]
+
+        for attempt in range(GCAL_MAX_RETRIES):
+            by_id = dict(pending)
+            retry = []
+
+            def on_result(request_id, response, exception):
+                # Rate-limited / 5xx sub-requests are resent in a later batch;
+                # everything else is final and goes to the caller.
+                if is_retryable(exception) and attempt < GCAL_MAX_RETRIES - 1:
+                    retry.append((request_id, by_id[request_id], exception))
+                else:
+                    callback(request_id, response, exception)
+
+            batch = gcal.new_batch_http_request(callback=on_result)
+            for request_id, request in pending:
+                batch.add(request, request_id=request_id)
+            try:
+                call_with_backoff(batch, cost=len(pending))
+            except RefreshError:
+                # Dead credentials fail every batch; abort the whole sync
+                raise
+            except Exception as e:
+                # The whole batch failed (transport error); the sub-requests were
+                # not applied, so their mappings stay untouched for the next run.
+                logger.error(f"Batch request of {len(pending)} calls failed: {e}")
+                break
+
+            if not retry:
+                break
+            delay = max(backoff_delay(attempt, google_retry_after(exc)) for _, _, exc in retry)
+            logger.warning(f"{len(retry)} batched calls were rate limited, retrying in {delay:.1f}s...")
+            time.sleep(delay)
+            pending = [(request_id, request) for request_id, request, _ in retry]
+
+
 def execute_sync_plan(gcal, plan, clean_log, dry_run=False):
     """
     Executes the calculated sync plan.
+    Calendar writes are grouped into batch requests (one HTTP round trip per
+    GCAL_BATCH_SIZE events) instead of one request per event.
     """
     synced = plan["synced_dict"]
+    checked_at = plan["checked_at"]
     stats = {"created": 0, "updated": 0, "deleted": 0}
 
     # 1. Updates
+    updates = {}
+    recreates = []
+    requests = []
     for item in plan["to_update"]:
         notion_id = item["notion_id"]
         event = item["event"]
         g_event_id = item["gcal_id"]
-        current_hash = item["current_hash"]
-        body = build_event_body(event)
+        body = item["body"]
 
         logger.info(f"Updating event: {event['title']}")
         if clean_log:
              clean_log.info(f"🔄 Updated: {event['title']}")
 
         if not dry_run:
-            try:
-                gcal.events().update(
-                    calendarId=CALENDAR_ID,
-                    eventId=g_event_id,
-                    body=body,
-                ).execute()
-                synced[notion_id] = {"gcal_id": g_event_id, "hash": current_hash}
-                stats["updated"] += 1
-            except HttpError as e:
-                # Handle 404 (Re-create)
-                if e.resp.status == 404:
-                    logger.warning(f"Event {g_event_id} not found (404). Re-creating.")
-                    try:
-                        created = gcal.events().insert(calendarId=CALENDAR_ID, body=body).execute()
-                        synced[notion_id] = {"gcal_id": created["id"], "hash": current_hash}
-                        stats["created"] += 1  # Count as create effectively
-                    except Exception as ce:
-                        logger.error(f"Failed to re-create {event['title']}: {ce}")
-                else:
-                    logger.error(f"Failed to update {event['title']}: {e}")
-            except Exception as e:
-                logger.error(f"Failed to update {event['title']}: {e}")
+            updates[notion_id] = item
+            requests.append((notion_id, gcal.events().update(
+                calendarId=CALENDAR_ID,
+                eventId=g_event_id,
+                body=body,
+                fields="id",  # Response is unused; don't ship the whole event back
+            )))
         else:
             logger.info(f"[Dry Run] Would update {g_event_id}")
             stats["updated"] += 1
 
+    def on_updated(notion_id, response, exception):
+        item = updates[notion_id]
+        event = item["event"]
+        g_event_id = item["gcal_id"]
+        current_hash = item["current_hash"]
+
+        if exception is None:
+            synced[notion_id] = {
+                "gcal_id": g_event_id,
+                "hash": current_hash,
+                "last_edited_time": synced_edit_time(event),
+                "synced_at": checked_at,
+            }
+            stats["updated"] += 1
+        elif isinstance(exception, HttpError) and exception.resp.status == 404:
+            # Handle 404 (Re-create): queued into the create batches below
+            logger.warning(f"Event {g_event_id} not found (404). Re-creating.")
+            recreates.append(item)
+        else:
+            logger.error(f"Failed to update {event['title']}: {exception}")
+
+    execute_batched(gcal, requests, on_updated)
+
     # 2. Creates
+    creates = {}
+    requests = []
     for item in plan["to_create"]:
         notion_id = item["notion_id"]
         event = item["event"]
-        current_hash = item["current_hash"]
-        body = build_event_body(event)
+        body = item["body"]
 
         logger.info(f"Creating event: {event['title']}")
         if clean_log:
              clean_log.info(f"🆕 Created: {event['title']}")
 
         if not dry_run:
-            try:
-                created = gcal.events().insert(calendarId=CALENDAR_ID, body=body).execute()
-                synced[notion_id] = {"gcal_id": created["id"], "hash": current_hash}
-                stats["created"] += 1
-            except Exception as e:
-                 logger.error(f"Failed to create {event['title']}: {e}")
+            creates[notion_id] = item
+            requests.append((notion_id, gcal.events().insert(
+                calendarId=CALENDAR_ID, body=body, fields="id"
+            )))
         else:
             logger.info(f"[Dry Run] Would create event")
             stats["created"] += 1
 
+    # Updates that hit a 404 are re-created (counted as creates effectively)
+    for item in recreates:
+        creates[item["notion_id"]] = item
+        requests.append((item["notion_id"], gcal.events().insert(
+            calendarId=CALENDAR_ID, body=item["body"], fields="id"
+        )))
+
+    def on_created(notion_id, response, exception):
+        item = creates[notion_id]
+        if exception is None:
+            synced[notion_id] = {
+                "gcal_id": response["id"],
+                "hash": item["current_hash"],
+                "last_edited_time": synced_edit_time(item["event"]),
+                "synced_at": checked_at,
+            }
+            stats["created"] += 1
+        else:
+            logger.error(f"Failed to create {item['event']['title']}: {exception}")
+
+    execute_batched(gcal, requests, on_created)
+
     # 3. Deletes
+    deletes = {}
+    requests = []
     for item in plan["to_delete"]:
         notion_id = item["notion_id"]
         g_id = item["gcal_id"]
@@ -543,38 +989,111 @@ def execute_sync_plan(gcal, plan, clean_log, dry_run=False):
              clean_log.info(f"🗑️ Deleted event: {display_name}")
 
         if not dry_run:
-            try:
-                gcal.events().delete(calendarId=CALENDAR_ID, eventId=g_id).execute()
-                del synced[notion_id]
-                stats["deleted"] += 1
-            except HttpError as e:
-                if e.resp.status in [404, 410]:
-                     # Already gone, just cleanup local
-                     logger.warning(f"Event {g_id} already gone from Google (Status {e.resp.status}).")
-                     del synced[notion_id]
-                     stats["deleted"] += 1
-                else: 
-                     logger.error(f"Failed to delete {g_id}: {e}")
-            except Exception as e:
-                 logger.error(f"Failed to delete {g_id}: {e}")
+            deletes[notion_id] = g_id
+            requests.append((notion_id, gcal.events().delete(calendarId=CALENDAR_ID, eventId=g_id)))
         else:
              logger.info(f"[Dry Run] Would delete {g_id}")
              stats["deleted"] += 1
 
+    def on_deleted(notion_id, response, exception):
+        g_id = deletes[notion_id]
+        if exception is None:
+            del synced[notion_id]
+            stats["deleted"] += 1
+        elif isinstance(exception, HttpError) and exception.resp.status in [404, 410]:
+             # Already gone, just cleanup local
+             logger.warning(f"Event {g_id} already gone from Google (Status {exception.resp.status}).")
+             del synced[notion_id]
+             stats["deleted"] += 1
+        else: 
+             logger.error(f"Failed to delete {g_id}: {exception}")
+
+    execute_batched(gcal, requests, on_deleted)
+
     return stats
 
 
-def sync_events(gcal, notion_events, synced_data, clean_log=None, dry_run=False):
+def list_calendar_changes(gcal, sync_token=None):
+    """
+    Lists calendar events changed since `sync_token` (all live events if None).
+    Returns (items, next_sync_token). Raises HttpError 410 if Google has
+    expired the token.
+    """
+    items = []
+    page_token = None
+    while True:
+        params = {
+            "calendarId": CALENDAR_ID,
+            "pageToken": page_token,
+            "maxResults": 2500,
+            "fields": "items(id,status),nextPageToken,nextSyncToken",
+        }
+        if sync_token:
+            params["syncToken"] = sync_token
+        result = call_with_backoff(gcal.events().list(**params))
+        items.extend(result.get("items", []))
+        page_token = result.get("nextPageToken")
+        if not page_token:
+            return items, result.get("nextSyncToken")
+
+
+def reconcile_calendar(gcal, synced_data):
+    """
+    Drops mappings whose Google event was deleted on the calendar side, so the
+    plan re-creates them instead of updating a missing event.
+    Uses the stored incremental sync token; falls back to a full listing when
+    there is none or Google expired it (410).
+    Returns the new sync token, to be persisted once the sync succeeds.
+    """
     synced = synced_data.get("events", {})
-    # Backwards compatibility
-    if "events" not in synced_data and synced_data:
-         first_key = next(iter(synced_data))
-         if isinstance(synced_data[first_key], (str, dict)):
-             synced = synced_data
-             synced_data["events"] = synced
-
-    notion_ids = set()
-    synced_copy = synced.copy()
+    sync_token = synced_data.get("google_sync_token")
+
+    try:
+        try:
+            items, next_token = list_calendar_changes(gcal, sync_token)
+        except HttpError as e:
+            if e.resp.status != 410:
+                raise
+            logger.info("Google sync token expired. Re-listing the calendar.")
+            sync_token = None
+            items, next_token = list_calendar_changes(gcal)
+    except RefreshError:
+        raise
+    except Exception as e:
+        logger.warning(f"Could not check Google Calendar for changes: {e}")
+        return None
+
+    if sync_token:
+        # Incremental: deleted events come back with status "cancelled"
+        gone = {item["id"] for item in items if item.get("status") == "cancelled"}
+        stale = [nid for nid, data in synced.items() if gcal_id_of(data) in gone]
+    else:
+        # Full listing: anything we don't see any more is gone
+        live = {item["id"] for item in items if item.get("status") != "cancelled"}
+        stale = [nid for nid, data in synced.items() if gcal_id_of(data) not in live]
+
+    for notion_id in stale:
+        logger.info(f"Event {gcal_id_of(synced[notion_id])} was removed from Google Calendar. Will re-create.")
+        del synced[notion_id]
+
+    return next_token
+
+
+def sync_events(gcal, notion_events, synced_data, clean_log=None, dry_run=False, checked_at=None):
+    """
+    `checked_at` is when the Notion pages were read (defaults to now); it is
+    stored with each entry to tell whether its last_edited_time can be trusted.
+    """
+    synced = synced_data.setdefault("events", {})
+    checked_at = checked_at or utc_now()
+    # A page whose last_edited_time matches the synced one is unchanged, as long
+    # as the stored hashes were computed with the current hash format and the
+    # time was settled when synced (see edit_time_settled).
+    trust_edit_times = synced_data.get("hash_version") == EVENT_HASH_VERSION
+
+    notion_by_id = {event["id"]: event for event in notion_events}
+    notion_ids = notion_by_id.keys()
+    synced_ids = synced.keys()
     
     # --- PLAN PHASE ---
     plan = {
@@ -582,56 +1101,62 @@ def sync_events(gcal, notion_events, synced_data, clean_log=None, dry_run=False)
         "to_update": [],
         "to_delete": [],
         "skipped_count": 0,
-        "synced_dict": synced # Reference to update
+        "synced_dict": synced, # Reference to update
+        "checked_at": checked_at,
     }
 
+    # Set arithmetic on the ID views; the lists below keep Notion/sync-file order.
+    to_create_ids = notion_ids - synced_ids
+    to_delete_ids = synced_ids - notion_ids
+
     # 1. Analyze Updates/Creates
-    for event in notion_events:
-        notion_id = event["id"]
-        notion_ids.add(notion_id)
-        current_hash = compute_event_hash(event)
-        
-        if notion_id in synced:
-            sync_data = synced[notion_id]
-            # Handle migration
-            if isinstance(sync_data, str):
-                g_event_id = sync_data
-                stored_hash = None
-            else:
-                g_event_id = sync_data.get("gcal_id")
-                stored_hash = sync_data.get("hash")
+    for notion_id, event in notion_by_id.items():
+        if notion_id in to_create_ids:
+            plan["to_create"].append({
+                "notion_id": notion_id,
+                "event": event,
+                "current_hash": compute_event_hash(event),
+                "body": build_event_body(event),
+            })
+            continue
 
-            if stored_hash == current_hash:
+        sync_data = synced[notion_id]
+        if isinstance(sync_data, str):
+            stored_hash = None
+        else:
+            stored_hash = sync_data.get("hash")
+            if (trust_edit_times and event["last_edited_time"]
+                    and sync_data.get("last_edited_time") == event["last_edited_time"]
+                    and edit_time_settled(event["last_edited_time"], sync_data.get("synced_at"))):
                 plan["skipped_count"] += 1
-                # Format update even if skipped
-                if isinstance(sync_data, str):
-                     synced[notion_id] = {"gcal_id": g_event_id, "hash": current_hash}
-            else:
-                plan["to_update"].append({
-                    "notion_id": notion_id,
-                    "event": event,
-                    "gcal_id": g_event_id,
-                    "current_hash": current_hash
-                })
+                continue
+
+        g_event_id = gcal_id_of(sync_data)
+        current_hash = compute_event_hash(event)
+        if stored_hash == current_hash:
+            plan["skipped_count"] += 1
+            # Format update even if skipped (also records last_edited_time)
+            synced[notion_id] = {
+                "gcal_id": g_event_id,
+                "hash": current_hash,
+                "last_edited_time": synced_edit_time(event),
+                "synced_at": checked_at,
+            }
         else:
-            plan["to_create"].append({
+            plan["to_update"].append({
                 "notion_id": notion_id,
                 "event": event,
-                "current_hash": current_hash
+                "gcal_id": g_event_id,
+                "current_hash": current_hash,
+                "body": build_event_body(event),
             })
 
     # 2. Analyze Deletes
-    for notion_id, sync_data in synced_copy.items():
-        if notion_id not in notion_ids:
-             if isinstance(sync_data, str):
-                 g_id = sync_data
-             else:
-                 g_id = sync_data.get("gcal_id")
-             
-             plan["to_delete"].append({
-                 "notion_id": notion_id,
-                 "gcal_id": g_id
-             })
+    plan["to_delete"] = [
+        {"notion_id": notion_id, "gcal_id": gcal_id_of(sync_data)}
+        for notion_id, sync_data in synced.items()
+        if notion_id in to_delete_ids
+    ]
 
     # --- REPORT PHASE ---
     # Calculate totals
@@ -663,6 +1188,7 @@ def sync_events(gcal, notion_events, synced_data, clean_log=None, dry_run=False)
     stats = execute_sync_plan(gcal, plan, clean_log, dry_run)
     
     # Save
+    synced_data["hash_version"] = EVENT_HASH_VERSION
     save_synced_events(synced_data, dry_run=dry_run)
     
     logger.info("--------------------------------------------------")
@@ -701,12 +1227,14 @@ def run_sync(dry_run=False, force=False):
 
     try:
         # Initialize Notion
-        notion = NotionClient(auth=token)
+        notion = create_notion_client(token)
 
         # 1. Smart Polling Check (Fingerprint)
         synced_data = load_synced_events()
         last_fingerprint = synced_data.get("db_fingerprint")
-        current_fingerprint = get_database_fingerprint(notion, db_id)
+        # Taken before the scan: nothing read afterwards can predate it
+        checked_at = utc_now()
+        current_fingerprint, pages = scan_database(notion, db_id)
 
         if not force and not dry_run and last_fingerprint and current_fingerprint:
             # If fingerprint matches, NO changes (including deletions) occurred.
@@ -716,12 +1244,21 @@ def run_sync(dry_run=False, force=False):
             else:
                  logger.info(f"Change detected (Fingerprint {last_fingerprint[:8]}... -> {current_fingerprint[:8]}...). Syncing...")
 
-        # 2. Authenticate Google
-        # In dry run, we still auth to ensure credentials work, unless we want to be totally offline.
-        gcal = authenticate_google()
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            # 2. Authenticate Google
+            # In dry run, we still auth to ensure credentials work, unless we want to be totally offline.
+            # Runs in the background: token refresh + service build overlap the Notion fetch.
+            gcal_future = pool.submit(authenticate_google)
+
+            # 3. Fetch Events
+            content_cache = load_content_cache()
+            # Reuses the fingerprint scan's pages; re-lists only if the scan failed
+            notion_events = get_notion_events(notion, db_id, content_cache, pages)
+
+            gcal = gcal_future.result()
 
-        # 3. Fetch Events
-        notion_events = get_notion_events(token, db_id)
+        # Pick up events deleted directly in Google Calendar
+        sync_token = reconcile_calendar(gcal, synced_data)
         
         # --- SAFETY GUARD ---
         # If Notion returns 0 events but we have many synced events (e.g. >10), 
@@ -733,21 +1270,35 @@ def run_sync(dry_run=False, force=False):
             logger.error(f"SAFETY GUARD: Notion returned 0 events, but you have {synced_count} currently synced.")
             logger.error("This looks like an anomaly. To convert these deletions, run with --force.")
             return False
+
+        # Evict cached content of pages that are gone from the database. Done
+        # after the guard so a failed listing can't wipe the whole cache.
+        live_ids = {event["id"] for event in notion_events}
+        for page_id in [pid for pid in content_cache if pid not in live_ids]:
+            del content_cache[page_id]
+        save_content_cache(content_cache, dry_run=dry_run)
             
         # 4. Sync
         clean_log = get_clean_logger()
-        sync_events(gcal, notion_events, synced_data, clean_log=clean_log, dry_run=dry_run)
-
-        # 5. Update last_run/fingerprint if successful and not dry-run
-        if not dry_run and current_fingerprint:
-            synced_data["db_fingerprint"] = current_fingerprint
-            # We update last_run just for human reference
-            from datetime import datetime
-            synced_data["last_run"] = datetime.now().isoformat()
+        sync_events(gcal, notion_events, synced_data, clean_log=clean_log, dry_run=dry_run, checked_at=checked_at)
+
+        # 5. Update last_run/fingerprint/sync token if successful and not dry-run
+        if not dry_run and (current_fingerprint or sync_token):
+            if sync_token:
+                synced_data["google_sync_token"] = sync_token
+            if current_fingerprint:
+                synced_data["db_fingerprint"] = current_fingerprint
+                # We update last_run just for human reference
+                synced_data["last_run"] = datetime.now().isoformat()
             save_synced_events(synced_data)
         
         return True
 
+    except RefreshError as e:
+        # Drop the cached service so the next run re-reads token.json / logs in again
+        authenticate_google.cache_clear()
+        logger.error(f"Google credentials are no longer valid: {e}")
+        raise e
     except Exception as e:
         logger.exception(f"Fatal error during sync: {e}")
         raise e
@@ -1,15 +1,27 @@
 import os
+import time
+import random
 import logging
+import functools
+import threading
 import sys
+from concurrent.futures import ThreadPoolExecutor
+import httplib2
+from google_auth_httplib2 import AuthorizedHttp
 from google.oauth2.credentials import Credentials
 from google_auth_oauthlib.flow import InstalledAppFlow
 from googleapiclient.discovery import build
+from googleapiclient.errors import HttpError
 from google.auth.transport.requests import Request
+from google.auth.exceptions import RefreshError
 
 # Configuration
 CALENDAR_ID = "primary"
 SYNC_FILE = "synced_events.json"
 SCOPES = ["https://www.googleapis.com/auth/calendar"]
+BATCH_SIZE = 50  # Max sub-requests per Calendar batch request
+MAX_WORKERS = 8  # Batches in flight at once
+MAX_RETRIES = 5  # Attempts per batch on rate limits
 
 # Setup simple logging
 logging.basicConfig(
@@ -19,8 +31,12 @@ logging.basicConfig(
 )
 logger = logging.getLogger("reset_sync")
 
-def authenticate_google():
-    """Authenticate with Google Calendar."""
+@functools.lru_cache(maxsize=1)
+def get_credentials():
+    """
+    Load (or refresh / create) Google credentials.
+    Cached for the process, so scripts importing this module don't reload them.
+    """
     creds = None
     if os.path.exists("token.json"):
         try:
@@ -43,49 +59,141 @@ def authenticate_google():
         with open("token.json", "w") as token:
             token.write(creds.to_json())
 
-    return build("calendar", "v3", credentials=creds)
+    return creds
 
-def main():
-    logger.info("Starting safely reset process...")
-    
-    # 1. Google Calendar Cleanup
-    try:
-        service = authenticate_google()
-        logger.info("Authenticated with Google Calendar.")
-        
-        events_to_delete = []
-        page_token = None
-        
-        logger.info("Scanning for Notion-synced events (source=notion-sync)...")
+def authenticate_google(creds):
+    """Authenticate with Google Calendar."""
+    # One explicit keep-alive connection for the listing calls, and no
+    # discovery-doc cache lookups (the doc ships with the client).
+    http = AuthorizedHttp(creds, http=httplib2.Http())
+    return build("calendar", "v3", http=http, cache_discovery=False)
+
+_thread_local = threading.local()
+
+def thread_http(creds):
+    """httplib2.Http is not thread-safe, so every worker thread gets its own."""
+    if not hasattr(_thread_local, "http"):
+        _thread_local.http = AuthorizedHttp(creds, http=httplib2.Http())
+    return _thread_local.http
+
+def is_rate_limited(exc):
+    if not isinstance(exc, HttpError):
+        return False
+    if exc.resp.status == 403:
+        # 403 is also used for real permission errors; only retry rate limits.
+        return b"ateLimitExceeded" in (exc.content or b"")
+    return exc.resp.status == 429
+
+def delete_batch(service, creds, event_ids):
+    """
+    Deletes up to BATCH_SIZE events in one batch request, retrying
+    rate-limited deletes with exponential backoff.
+    Returns a list of (event_id, exception) for the deletes that failed.
+    """
+    failures = []
+    pending = event_ids
+    for attempt in range(MAX_RETRIES):
+        retry = []
+        last_attempt = attempt == MAX_RETRIES - 1
+
+        def on_deleted(request_id, response, exception):
+            if exception is None:
+                return
+            if is_rate_limited(exception) and not last_attempt:
+                retry.append(request_id)
+            else:
+                failures.append((request_id, exception))
+
+        batch = service.new_batch_http_request(callback=on_deleted)
+        for event_id in pending:
+            batch.add(
+                service.events().delete(calendarId=CALENDAR_ID, eventId=event_id),
+                request_id=event_id
+            )
+        try:
+            batch.execute(http=thread_http(creds))
+        except Exception as e:
+            if not is_rate_limited(e) or last_attempt:
+                failures.extend((event_id, e) for event_id in pending)
+                break
+            retry = pending
+
+        if not retry:
+            break
+        time.sleep(min(2 ** attempt, 32) + random.random())
+        pending = retry
+
+    return failures
+
+def delete_synced_events(service, creds):
+    """
+    Lists the synced events and deletes them as the pages arrive: each page's
+    IDs go to the delete pool right away while the next page is fetched.
+    Returns (number of events found, [(event_id, exception), ...]).
+    """
+    count = 0
+    futures = []
+    page_token = None
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as pool:
         while True:
             events_result = service.events().list(
                 calendarId=CALENDAR_ID,
                 privateExtendedProperty=['source=notion-sync'],
                 pageToken=page_token,
-                singleEvents=True
+                singleEvents=True,
+                maxResults=2500,  # Calendar's max page size
+                fields="items(id),nextPageToken"  # Only the IDs are needed
             ).execute()
-            
-            events = events_result.get('items', [])
-            events_to_delete.extend(events)
-            
+
+            event_ids = [event['id'] for event in events_result.get('items', [])]
+            # One HTTP round trip per BATCH_SIZE deletes, several batches in flight
+            for i in range(0, len(event_ids), BATCH_SIZE):
+                futures.append(pool.submit(delete_batch, service, creds, event_ids[i:i + BATCH_SIZE]))
+            count += len(event_ids)
+            if event_ids:
+                logger.info(f"Found {count} events so far, deleting...")
+
             page_token = events_result.get('nextPageToken')
             if not page_token:
                 break
+
+        failures = []
+        for future in futures:
+            failures.extend(future.result())
+    return count, failures
+
+def main():
+    logger.info("Starting safely reset process...")
+    
+    # 1. Google Calendar Cleanup
+    try:
+        creds = get_credentials()
+        service = authenticate_google(creds)
+        logger.info("Authenticated with Google Calendar.")
         
-        count = len(events_to_delete)
-        if count == 0:
+        logger.info("Scanning for Notion-synced events (source=notion-sync)...")
+        deleted = 0
+        while True:
+            count, failures = delete_synced_events(service, creds)
+            for event_id, e in failures:
+                logger.error(f"Failed to delete event {event_id}: {e}")
+            deleted += count - len(failures)
+            # Deleting while paging could shift later pages, so list again
+            # until a pass finds nothing (or can't delete anything it found).
+            if count == 0 or len(failures) == count:
+                break
+            logger.info("Re-scanning for events missed while deleting...")
+
+        if deleted == 0 and count == 0:
             logger.info("No synced events found in Google Calendar.")
         else:
-            logger.info(f"Found {count} events to delete. Deleting now...")
-            for i, event in enumerate(events_to_delete, 1):
-                try:
-                    service.events().delete(calendarId=CALENDAR_ID, eventId=event['id']).execute()
-                    if i % 10 == 0:
-                        logger.info(f"Deleted {i}/{count} events...")
-                except Exception as e:
-                    logger.error(f"Failed to delete event {event.get('id')}: {e}")
-            logger.info("Calendar cleanup complete.")
+            logger.info(f"Calendar cleanup complete. Deleted {deleted} events.")
             
+    except RefreshError as e:
+        # The cached credentials are dead; don't hand them out again
+        get_credentials.cache_clear()
+        logger.error(f"Failed during Calendar cleanup: {e}")
+        return
     except Exception as e:
         logger.error(f"Failed during Calendar cleanup: {e}")
         return
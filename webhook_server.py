@@ -1,7 +1,10 @@
-import hashlib
 import hmac
+import json
 import os
 import threading
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from typing import Any
 
 from flask import Flask, abort, jsonify, request
@@ -14,9 +17,13 @@ load_dotenv()
 from notion_to_gcal import run_sync
 
 WEBHOOK_SECRET = os.environ.get("NOTION_WEBHOOK_SECRET")
+_SECRET_BYTES = WEBHOOK_SECRET.encode("utf-8") if WEBHOOK_SECRET else None
 WEBHOOK_PATH = os.environ.get("WEBHOOK_PATH", "/notion/webhook")
 WEBHOOK_PORT = int(os.environ.get("WEBHOOK_PORT", "8000"))
 DATABASE_ID = os.environ.get("NOTION_DATABASE_ID")
+WEBHOOK_THREADS = int(os.environ.get("WEBHOOK_THREADS", "8"))
+# Dashless, lowercase form of DATABASE_ID, the form payload IDs are compared in
+_TARGET_DB_ID = DATABASE_ID.replace("-", "").lower() if DATABASE_ID else None
 
 # Normalize the path so both "/path" and "path" are accepted.
 if not WEBHOOK_PATH.startswith("/"):
@@ -35,52 +42,125 @@ def verify_signature(raw_body: bytes, signature_header: str | None) -> bool:
         print("⚠️ Missing X-Notion-Signature header.")
         return False
 
-    expected = "sha256=" + hmac.new(
-        WEBHOOK_SECRET.encode("utf-8"), raw_body, hashlib.sha256
-    ).hexdigest()
+    # One-shot C implementation, no HMAC object per request. Compared as
+    # bytes; a non-ASCII header just fails the comparison.
+    expected = b"sha256=" + hmac.digest(_SECRET_BYTES, raw_body, "sha256").hex().encode("ascii")
+    received = signature_header.encode("ascii", errors="replace")
 
-    if not hmac.compare_digest(expected, signature_header):
+    if not hmac.compare_digest(expected, received):
         print("⚠️ Signature mismatch.")
         return False
     return True
 
 
+_ID_KEYS = {"database_id", "parent_id", "id"}
+
+
+def is_target_id(value: Any) -> bool:
+    """True if `value` is the target database ID, with or without dashes."""
+    # A Notion ID is 32 hex chars, 36 with dashes; anything else can be
+    # rejected without building a normalized copy.
+    return (
+        isinstance(value, str)
+        and len(value) in (32, 36)
+        and value.replace("-", "").lower() == _TARGET_DB_ID
+    )
+
+
 def payload_targets_database(payload: Any) -> bool:
     """Check if the payload references our target database."""
-    if not DATABASE_ID:
+    if not _TARGET_DB_ID:
         # If we don't know the DB ID, we can't filter, so we assume yes? 
         # Or better to be safe and allow it, but sync will fail if env var missing there too.
         return True
 
-    target = DATABASE_ID.replace("-", "")
-    seen: set[str] = set()
-
-    def walk(node: Any):
+    # Fast path: the places where Notion puts the database ID in its events
+    if isinstance(payload, dict):
+        data = payload.get("data")
+        parent = data.get("parent") if isinstance(data, dict) else None
+        entity = payload.get("entity")
+        candidates = []
+        if isinstance(parent, dict):
+            candidates += [parent.get("database_id"), parent.get("id")]
+        if isinstance(entity, dict) and entity.get("type") == "database":
+            candidates.append(entity.get("id"))
+        if any(is_target_id(candidate) for candidate in candidates):
+            return True
+
+    # Otherwise look anywhere in the payload, stopping at the first match
+    def walk(node: Any) -> bool:
         if isinstance(node, dict):
-            for k, v in node.items():
-                if k in {"database_id", "parent_id", "id"} and isinstance(v, str):
-                    seen.add(v.replace("-", ""))
-                walk(v)
-        elif isinstance(node, list):
-            for item in node:
-                walk(item)
+            return any(
+                (k in _ID_KEYS and is_target_id(v)) or walk(v)
+                for k, v in node.items()
+            )
+        if isinstance(node, list):
+            return any(walk(item) for item in node)
+        return False
 
-    walk(payload)
-    return target in seen or target in str(payload).replace("-", "")
+    return walk(payload)
 
 
-def trigger_sync_async():
-    """Kick off the sync without blocking the webhook response."""
+# Set by webhooks, cleared by the worker when it starts a sync. Any number of
+# webhooks arriving during a sync collapse into a single follow-up sync.
+_sync_requested = threading.Event()
+
+
+_sync_pool: ProcessPoolExecutor | None = None
+
 
-    def _runner():
+def _run_sync_in_subprocess():
+    """
+    Runs one sync in a separate process, so its CPU work doesn't hold the
+    GIL while requests are being served. The process is reused across syncs
+    (and keeps its Google service), and replaced if it dies.
+    """
+    global _sync_pool
+    if _sync_pool is None:
+        # spawn, not fork: forking a process that is running server threads
+        # can copy locks in a held state.
+        _sync_pool = ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context("spawn"))
+    try:
+        return _sync_pool.submit(run_sync, force=True).result()
+    except BrokenProcessPool:
+        _sync_pool = None
+        raise
+
+
+def _sync_worker():
+    """Runs syncs one at a time, whenever a webhook has asked for one."""
+    while True:
+        _sync_requested.wait()
+        _sync_requested.clear()
         try:
             # We force api sync because the webhook told us there's a change
             print("🚀 Webhook triggered sync starting...")
-            run_sync(force=True)
+            _run_sync_in_subprocess()
         except Exception as exc: 
             print(f"⚠️ Sync failed: {exc}")
 
-    threading.Thread(target=_runner, daemon=True).start()
+
+_worker_lock = threading.Lock()
+_worker_thread: threading.Thread | None = None
+
+
+def _ensure_sync_worker():
+    """
+    Start the worker on first use rather than at import: gunicorn's
+    preload_app imports this module in the master and then forks, and
+    threads don't survive a fork.
+    """
+    global _worker_thread
+    with _worker_lock:
+        if _worker_thread is None or not _worker_thread.is_alive():
+            _worker_thread = threading.Thread(target=_sync_worker, name="sync-worker", daemon=True)
+            _worker_thread.start()
+
+
+def trigger_sync_async():
+    """Kick off the sync without blocking the webhook response."""
+    _ensure_sync_worker()
+    _sync_requested.set()
 
 
 @app.route(WEBHOOK_PATH, methods=["POST"])
@@ -91,7 +171,13 @@ def notion_webhook():
     if not verify_signature(raw_body, signature):
         abort(401)
 
-    payload = request.get_json(silent=True) or {}
+    # Parse the body we already read, and only when it is needed for filtering
+    payload = {}
+    if _TARGET_DB_ID and raw_body:
+        try:
+            payload = json.loads(raw_body)
+        except ValueError:
+            payload = {}
 
     if not payload_targets_database(payload):
         return jsonify({"status": "ignored", "reason": "different_database"}), 200
@@ -107,7 +193,15 @@ def health():
 
 def run_server():
     """Start the webhook listener."""
-    app.run(host="0.0.0.0", port=WEBHOOK_PORT)
+    try:
+        from waitress import serve
+    except ImportError:
+        # Flask's dev server; threaded so one slow request doesn't block the rest
+        app.run(host="0.0.0.0", port=WEBHOOK_PORT, threaded=True)
+        return
+
+    print(f"Serving with waitress ({WEBHOOK_THREADS} threads) on port {WEBHOOK_PORT}")
+    serve(app, host="0.0.0.0", port=WEBHOOK_PORT, threads=WEBHOOK_THREADS)
 
 
 if __name__ == "__main__":